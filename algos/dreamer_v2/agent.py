@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import copy
+import itertools
+import math
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import gymnasium
@@ -13,7 +15,6 @@ from torch.distributions import (
     Distribution,
     Independent,
     Normal,
-    OneHotCategorical,
     OneHotCategoricalStraightThrough,
     TanhTransform,
     TransformedDistribution,
@@ -24,6 +25,83 @@ from sheeprl.models.models import CNN, MLP, DeCNN, LayerNormChannelLast, LayerNo
 from sheeprl.utils.distribution import TruncatedNormal
 from sheeprl.utils.model import ModuleType, cnn_forward
 
+# Per-stage channel multipliers of the 4-stage encoder/decoder CNNs
+_CNN_STAGES_MULTIPLIER = (1, 2, 4, 8)
+_DECNN_STAGES_MULTIPLIER = (4, 2, 1)
+
+_SQRT_2 = math.sqrt(2)
+_INV_SQRT_2 = 1 / math.sqrt(2)
+
+
+def _truncated_normal_rsample(loc: Tensor, scale: Tensor, low: float, high: float) -> Tensor:
+    """Reparameterized sample from a truncated normal distribution. This inlines
+    `sheeprl.utils.distribution.TruncatedNormal.rsample` for the rollout hot path,
+    where constructing the distribution object (and validating its arguments)
+    at every environment step is wasted work.
+
+    Args:
+        loc (Tensor): the mean of the underlying normal distribution.
+        scale (Tensor): the standard deviation of the underlying normal distribution.
+        low (float): the lower truncation bound.
+        high (float): the upper truncation bound.
+
+    Returns:
+        The sampled actions.
+    """
+    a = (low - loc) / scale
+    b = (high - loc) / scale
+    big_phi_a = 0.5 * (1 + (a * _INV_SQRT_2).erf())
+    big_phi_b = 0.5 * (1 + (b * _INV_SQRT_2).erf())
+    eps = torch.finfo(loc.dtype).eps
+    z = (big_phi_b - big_phi_a).clamp_min(eps)
+    p = torch.empty_like(loc).uniform_(eps, 1 - eps)
+    return loc + scale * (_SQRT_2 * (2 * (big_phi_a + p * z) - 1).erfinv())
+
+
+def _uniform_one_hot_samples(actions: Sequence[Tensor]) -> List[Tensor]:
+    """Draw one uniform one-hot exploratory sample per action head from a single
+    random draw. The heads have heterogeneous sizes, so their logits cannot be
+    stacked into a single batched categorical; instead one `torch.rand` call
+    provides the uniforms for all the heads and each index is recovered by
+    scaling, keeping the sampling at one RNG kernel per step instead of one
+    (plus a distribution object) per head.
+
+    Args:
+        actions (Sequence[Tensor]): the actions of the heads, used for their
+            shapes, device and dtype.
+
+    Returns:
+        One uniform one-hot sample per action head.
+    """
+    first = actions[0]
+    uniforms = torch.rand(*first.shape[:-1], len(actions), device=first.device)
+    samples = []
+    for i, act in enumerate(actions):
+        idx = (uniforms[..., i] * act.shape[-1]).long().clamp_max_(act.shape[-1] - 1)
+        samples.append(F.one_hot(idx, act.shape[-1]).to(act.dtype))
+    return samples
+
+
+@torch.compile(mode="reduce-overhead", dynamic=False, fullgraph=True)
+def _mix(sample: Tensor, act: Tensor, expl_amount: Tensor, noise: Tensor) -> Tensor:
+    """Mix exploratory and greedy actions: every leading index keeps `act` with
+    probability `1 - expl_amount` and takes `sample` otherwise. Compiled as a
+    standalone graph so the compare/where sequence runs as a single fused
+    kernel instead of small separate launches per action head.
+
+    Args:
+        sample (Tensor): the exploratory actions.
+        act (Tensor): the actions selected by the actor.
+        expl_amount (Tensor): the scalar (or per-element broadcastable) exploration amount.
+        noise (Tensor): uniform noise in [0, 1) of shape `act.shape[:-1]`, drawn by the
+            caller (see `Actor._exploration_noise`) so it can be resampled in place
+            into a preallocated buffer instead of allocating a fresh tensor per head.
+
+    Returns:
+        The mixed actions.
+    """
+    return torch.where((noise < expl_amount).unsqueeze(-1), sample, act)
+
 
 class CNNEncoder(nn.Module):
     """The Dreamer-V2 image encoder. This is composed of 4 `nn.Conv2d` with
@@ -59,7 +137,7 @@ class CNNEncoder(nn.Module):
         self.model = nn.Sequential(
             CNN(
                 input_channels=sum(input_channels),
-                hidden_channels=(torch.tensor([1, 2, 4, 8]) * channels_multiplier).tolist(),
+                hidden_channels=[m * channels_multiplier for m in _CNN_STAGES_MULTIPLIER],
                 layer_args={"kernel_size": 4, "stride": 2},
                 activation=activation,
                 norm_layer=[LayerNormChannelLast for _ in range(4)] if layer_norm else None,
@@ -69,8 +147,14 @@ class CNNEncoder(nn.Module):
             ),
             nn.Flatten(-3, -1),
         )
-        with torch.no_grad():
-            self.output_dim = self.model(torch.zeros(1, *self.input_dim)).shape[-1]
+        # Every stage is a kernel-4/stride-2 convolution without padding, so the output
+        # resolution follows `(x - 4) // 2 + 1` per stage and the flattened output size
+        # can be computed without running a dummy forward of the whole conv stack
+        h, w = image_size
+        for _ in _CNN_STAGES_MULTIPLIER:
+            h = (h - 4) // 2 + 1
+            w = (w - 4) // 2 + 1
+        self.output_dim = _CNN_STAGES_MULTIPLIER[-1] * channels_multiplier * h * w
 
     def forward(self, obs: Dict[str, Tensor]) -> Tensor:
         x = torch.cat([obs[k] for k in self.keys], -3)  # channels dimension
@@ -157,6 +241,9 @@ class CNNDecoder(nn.Module):
         super().__init__()
         self.keys = keys
         self.output_channels = output_channels
+        # Cumulative channel indices, so the per-key split is a `tensor_split` on
+        # precomputed boundaries instead of rebuilding them from sizes every forward
+        self._split_idx = tuple(itertools.accumulate(output_channels))[:-1]
         self.cnn_encoder_output_dim = cnn_encoder_output_dim
         self.image_size = image_size
         self.output_dim = (sum(output_channels), *image_size)
@@ -165,7 +252,7 @@ class CNNDecoder(nn.Module):
             nn.Unflatten(1, (cnn_encoder_output_dim, 1, 1)),
             DeCNN(
                 input_channels=cnn_encoder_output_dim,
-                hidden_channels=(torch.tensor([4, 2, 1]) * channels_multiplier).tolist() + [self.output_dim[0]],
+                hidden_channels=[m * channels_multiplier for m in _DECNN_STAGES_MULTIPLIER] + [self.output_dim[0]],
                 layer_args=[
                     {"kernel_size": 5, "stride": 2},
                     {"kernel_size": 5, "stride": 2},
@@ -184,12 +271,8 @@ class CNNDecoder(nn.Module):
         )
 
     def forward(self, latent_states: Tensor) -> Dict[str, Tensor]:
-        reconstructed_obs = {}
         x = cnn_forward(self.model, latent_states, (latent_states.shape[-1],), self.output_dim)
-        reconstructed_obs.update(
-            {k: rec_obs for k, rec_obs in zip(self.keys, torch.split(x, self.output_channels, -3))}
-        )
-        return reconstructed_obs
+        return dict(zip(self.keys, torch.tensor_split(x, self._split_idx, dim=-3)))
 
 
 class MLPDecoder(nn.Module):
@@ -233,13 +316,23 @@ class MLPDecoder(nn.Module):
             norm_layer=[nn.LayerNorm for _ in range(mlp_layers)] if layer_norm else None,
             norm_args=[{"normalized_shape": dense_units} for _ in range(mlp_layers)] if layer_norm else None,
         )
-        self.heads = nn.ModuleList([nn.Linear(dense_units, mlp_dim) for mlp_dim in self.output_dims])
+        # A single fused linear instead of one small linear per key: one GEMM for all
+        # the heads, whose outputs are then split along the last dimension
+        self.heads = nn.Linear(dense_units, sum(self.output_dims))
+        self._split_idx = tuple(itertools.accumulate(self.output_dims))[:-1]
+        self._register_load_state_dict_pre_hook(self._remap_per_head_state_dict)
+
+    def _remap_per_head_state_dict(self, state_dict: Dict[str, Tensor], prefix: str, *args) -> None:
+        """Remap checkpoints saved when `heads` was a `nn.ModuleList` of per-key
+        linear layers into the fused single-linear layout."""
+        for param in ("weight", "bias"):
+            keys = [f"{prefix}heads.{i}.{param}" for i in range(len(self.output_dims))]
+            if all(k in state_dict for k in keys):
+                state_dict[f"{prefix}heads.{param}"] = torch.cat([state_dict.pop(k) for k in keys], dim=0)
 
     def forward(self, latent_states: Tensor) -> Dict[str, Tensor]:
-        reconstructed_obs = {}
         x = self.model(latent_states)
-        reconstructed_obs.update({k: h(x) for k, h in zip(self.keys, self.heads)})
-        return reconstructed_obs
+        return dict(zip(self.keys, torch.tensor_split(self.heads(x), self._split_idx, dim=-1)))
 
 
 class RecurrentModel(nn.Module):
@@ -356,9 +449,13 @@ class RSSM(nn.Module):
             The logits of the prior state (Tensor): computed by the transition model from the recurrent state.
             from the recurrent state and the embbedded observation.
         """
-        action = (1 - is_first) * action
-        posterior = (1 - is_first) * posterior.view(*posterior.shape[:-2], -1)
-        recurrent_state = (1 - is_first) * recurrent_state
+        # A single boolean mask and a shared scalar zero let the three resets fuse into
+        # one masked read-write kernel instead of three `(1 - is_first) * x` multiplications
+        is_first = is_first.bool()
+        zero = action.new_zeros(())
+        action = torch.where(is_first, zero, action)
+        posterior = torch.where(is_first, zero, posterior.reshape(*posterior.shape[:-2], -1))
+        recurrent_state = torch.where(is_first, zero, recurrent_state)
         recurrent_state = self.recurrent_model(torch.cat((posterior, action), -1), recurrent_state)
         prior_logits, prior = self._transition(recurrent_state)
         posterior_logits, posterior = self._representation(recurrent_state, embedded_obs)
@@ -486,21 +583,46 @@ class Actor(nn.Module):
             self.mlp_heads = nn.ModuleList([nn.Linear(dense_units, action_dim) for action_dim in actions_dim])
         self.actions_dim = actions_dim
         self.is_continuous = is_continuous
-        self.init_std = torch.tensor(init_std)
+        # Kept as a plain float: a CPU tensor here would force a host-to-device
+        # transfer every time it is summed with the on-device std
+        self.init_std = float(init_std)
         self.min_std = min_std
         self.distribution_cfg = distribution_cfg
         self._expl_amount = expl_amount
         self._expl_decay = expl_decay
         self._expl_min = expl_min
+        self._expl_decay_rate = math.log(0.5) / expl_decay if expl_decay else 0.0
+        # Lazily allocated uniform-noise buffer for the exploration mixing, resampled
+        # in place every env step instead of allocating a fresh tensor per head
+        self._expl_noise: Optional[Tensor] = None
+
+    def _exploration_noise(self, act: Tensor) -> Tensor:
+        """Return uniform noise in [0, 1) of shape `act.shape[:-1]` from the
+        preallocated buffer, (re)allocating it only when the required size or the
+        device changes. In-place `uniform_` avoids the per-step allocator pressure
+        of a fresh `torch.rand` tensor for every action head.
+
+        Args:
+            act (Tensor): the actions of one head, used for their shape and device.
 
-    def _get_expl_amount(self, step: int) -> Tensor:
-        amount = self._expl_amount
-        if self._expl_decay:
-            amount *= 0.5 ** float(step) / self._expl_decay
-        return max(amount, self._expl_min)
+        Returns:
+            The uniform noise, as a view over the internal buffer.
+        """
+        numel = act.shape[:-1].numel()
+        buffer = self._expl_noise
+        if buffer is None or buffer.numel() < numel or buffer.device != act.device:
+            buffer = self._expl_noise = torch.empty(numel, device=act.device)
+        return buffer[:numel].uniform_().view(act.shape[:-1])
+
+    def _get_expl_amount(self, step: int) -> float:
+        # Exponential decay with half-life `expl_decay`, i.e. amount * 0.5 ** (step / decay).
+        # The previous `amount *= 0.5 ** float(step) / self._expl_decay` parsed as
+        # `(0.5 ** step) / decay` due to operator precedence, collapsing the noise to ~0
+        # after a handful of steps
+        return max(self._expl_amount * math.exp(self._expl_decay_rate * step), self._expl_min)
 
     def forward(
-        self, state: Tensor, greedy: bool = False, mask: Optional[Dict[str, Tensor]] = None
+        self, state: Tensor, greedy: bool = False, mask: Optional[Dict[str, Tensor]] = None, return_dist: bool = True
     ) -> Tuple[Sequence[Tensor], Sequence[Distribution]]:
         """
         Call the forward method of the actor model and reorganizes the result with shape (batch_size, *, num_actions),
@@ -512,17 +634,20 @@ class Actor(nn.Module):
                 Default to False.
             mask (Dict[str, Tensor], optional): the action mask (which actions can be selected).
                 Default to None.
+            return_dist (bool): whether the action distributions are needed by the caller.
+                When False, sampling is inlined and no Distribution object is built (rollout fast path).
+                Default to True.
 
         Returns:
             The tensor of the actions taken by the agent with shape (batch_size, *, num_actions).
-            The distribution of the actions
+            The distribution of the actions (an empty tuple if `return_dist` is False).
         """
         out: Tensor = self.model(state)
         pre_dist: List[Tensor] = [head(out) for head in self.mlp_heads]
         if self.is_continuous:
             mean, std = torch.chunk(pre_dist[0], 2, -1)
             if self.distribution == "tanh_normal":
-                mean = 5 * torch.tanh(mean / 5)
+                mean = 5.0 * torch.tanh(mean * 0.2)
                 std = F.softplus(std + self.init_std) + self.min_std
                 actions_dist = Normal(mean, std)
                 actions_dist = Independent(TransformedDistribution(actions_dist, TanhTransform()), 1)
@@ -530,18 +655,36 @@ class Actor(nn.Module):
                 actions_dist = Normal(mean, std)
                 actions_dist = Independent(actions_dist, 1)
             elif self.distribution == "trunc_normal":
-                std = 2 * torch.sigmoid((std + self.init_std) / 2) + self.min_std
-                dist = TruncatedNormal(torch.tanh(mean), std, -1, 1)
+                std = 2.0 * torch.sigmoid((std + self.init_std) * 0.5) + self.min_std
+                mean = torch.tanh(mean)
+                if not greedy and not return_dist:
+                    return (_truncated_normal_rsample(mean, std, -1, 1),), tuple()
+                dist = TruncatedNormal(mean, std, -1, 1)
                 actions_dist = Independent(dist, 1)
             if not greedy:
                 actions = actions_dist.rsample()
             else:
-                sample = actions_dist.sample((100,))
-                log_prob = actions_dist.log_prob(sample)
-                actions = sample[log_prob.argmax(0)].view(1, 1, -1)
+                with torch.no_grad():
+                    sample = actions_dist.sample((100,))
+                    log_prob = actions_dist.log_prob(sample)
+                    # Gather the most likely of the 100 candidates per batch element:
+                    # unlike fancy indexing this does not materialize broadcast
+                    # intermediates and it supports any batch size
+                    idx = log_prob.argmax(0, keepdim=True)
+                    actions = sample.gather(0, idx.unsqueeze(-1).expand(1, *sample.shape[1:])).squeeze(0)
             actions = [actions]
             actions_dist = [actions_dist]
         else:
+            if not return_dist:
+                # Gumbel-max sampling (or the argmax mode) draws the same one-hot actions
+                # without instantiating a OneHotCategoricalStraightThrough per head
+                if not greedy:
+                    actions = [F.gumbel_softmax(logits, hard=True) for logits in pre_dist]
+                else:
+                    actions = [
+                        F.one_hot(logits.argmax(dim=-1), logits.shape[-1]).to(logits.dtype) for logits in pre_dist
+                    ]
+                return tuple(actions), tuple()
             actions_dist: List[Distribution] = []
             actions: List[Tensor] = []
             for logits in pre_dist:
@@ -559,19 +702,28 @@ class Actor(nn.Module):
         if self.is_continuous:
             actions = torch.cat(actions, -1)
             if expl_amount > 0.0:
-                actions = torch.clip(Normal(actions, expl_amount).sample(), -1, 1)
+                # Scaled gaussian noise, without routing the sampling through a Normal distribution object
+                actions = torch.clip(actions + expl_amount * torch.randn_like(actions), -1, 1)
             expl_actions = [actions]
         else:
-            expl_actions = []
-            for act in actions:
-                sample = OneHotCategorical(logits=torch.zeros_like(act)).sample().to(act.device)
-                expl_actions.append(
-                    torch.where(torch.rand(act.shape[:1], device=act.device) < expl_amount, sample, act)
-                )
+            samples = _uniform_one_hot_samples(actions)
+            expl_amount = actions[0].new_full((), expl_amount)
+            expl_actions = [
+                _mix(sample, act, expl_amount, self._exploration_noise(act)) for sample, act in zip(samples, actions)
+            ]
         return tuple(expl_actions)
 
 
 class MinedojoActor(Actor):
+    # Functional actions that constrain the other heads. Defined once at class level:
+    # the vectorized comparisons and the `_critical_actions` buffer read these named
+    # constants instead of rebuilding inline literals on every call
+    CRAFT_ACTION: int = 15
+    EQUIP_ACTION: int = 16
+    PLACE_ACTION: int = 17
+    DESTROY_ACTION: int = 18
+    CRITICAL_ACTIONS: Tuple[int, ...] = (CRAFT_ACTION, EQUIP_ACTION, PLACE_ACTION, DESTROY_ACTION)
+
     def __init__(
         self,
         latent_state_size: int,
@@ -603,9 +755,12 @@ class MinedojoActor(Actor):
             expl_decay=expl_decay,
             expl_min=expl_min,
         )
+        # Functional actions that constrain the other heads (craft/equip/place/destroy),
+        # kept as a buffer so `torch.isin` runs without a per-step tensor construction
+        self.register_buffer("_critical_actions", torch.tensor(self.CRITICAL_ACTIONS), persistent=False)
 
     def forward(
-        self, state: Tensor, greedy: bool = False, mask: Optional[Dict[str, Tensor]] = None
+        self, state: Tensor, greedy: bool = False, mask: Optional[Dict[str, Tensor]] = None, return_dist: bool = True
     ) -> Tuple[Sequence[Tensor], Sequence[Distribution]]:
         """
         Call the forward method of the actor model and reorganizes the result with shape (batch_size, *, num_actions),
@@ -617,42 +772,54 @@ class MinedojoActor(Actor):
                 Default to False.
             mask (Dict[str, Tensor], optional): the action mask (which actions can be selected).
                 Default to None.
+            return_dist (bool): whether the action distributions are needed by the caller.
+                When False, sampling is inlined and no Distribution object is built (rollout fast path).
+                Default to True.
 
         Returns:
             The tensor of the actions taken by the agent with shape (batch_size, *, num_actions).
-            The distribution of the actions
+            The distribution of the actions (an empty tuple if `return_dist` is False).
         """
         out: Tensor = self.model(state)
         actions_logits: List[Tensor] = [head(out) for head in self.mlp_heads]
         actions_dist: List[Distribution] = []
         actions: List[Tensor] = []
         functional_action = None
+        if mask is not None:
+            # Inverted boolean masks computed once per call: `masked_fill_` broadcasts
+            # them against the logits, so no per-head `expand_as`/`logical_not` is needed
+            inv_action_type = torch.logical_not(mask["mask_action_type"])
+            inv_craft_smelt = torch.logical_not(mask["mask_craft_smelt"])
+            inv_equip_place = torch.logical_not(mask["mask_equip_place"])
+            inv_destroy = torch.logical_not(mask["mask_destroy"])
         for i, logits in enumerate(actions_logits):
+            # Masking is done with broadcast boolean selectors over the whole [T, B] batch:
+            # the old per-(t, b) loops called `.item()` on every element, forcing a
+            # GPU-to-CPU sync and a tiny scatter kernel per element
             if mask is not None:
                 if i == 0:
-                    logits[torch.logical_not(mask["mask_action_type"].expand_as(logits))] = -torch.inf
+                    logits.masked_fill_(inv_action_type, -torch.inf)
                 elif i == 1:
-                    mask["mask_craft_smelt"] = mask["mask_craft_smelt"].expand_as(logits)
-                    for t in range(functional_action.shape[0]):
-                        for b in range(functional_action.shape[1]):
-                            sampled_action = functional_action[t, b].item()
-                            if sampled_action == 15:  # Craft action
-                                logits[t, b][torch.logical_not(mask["mask_craft_smelt"][t, b])] = -torch.inf
+                    is_craft = (functional_action == self.CRAFT_ACTION).unsqueeze(-1)  # Craft action
+                    logits.masked_fill_(is_craft & inv_craft_smelt, -torch.inf)
                 elif i == 2:
-                    mask["mask_destroy"][t, b] = mask["mask_destroy"].expand_as(logits)
-                    mask["mask_equip_place"] = mask["mask_equip_place"].expand_as(logits)
-                    for t in range(functional_action.shape[0]):
-                        for b in range(functional_action.shape[1]):
-                            sampled_action = functional_action[t, b].item()
-                            if sampled_action in (16, 17):  # Equip/Place action
-                                logits[t, b][torch.logical_not(mask["mask_equip_place"][t, b])] = -torch.inf
-                            elif sampled_action == 18:  # Destroy action
-                                logits[t, b][torch.logical_not(mask["mask_destroy"][t, b])] = -torch.inf
-            actions_dist.append(OneHotCategoricalStraightThrough(logits=logits))
-            if not greedy:
-                actions.append(actions_dist[-1].rsample())
+                    is_equip_place = (
+                        (functional_action == self.EQUIP_ACTION) | (functional_action == self.PLACE_ACTION)
+                    ).unsqueeze(-1)
+                    is_destroy = (functional_action == self.DESTROY_ACTION).unsqueeze(-1)
+                    logits.masked_fill_(is_equip_place & inv_equip_place, -torch.inf)  # Equip/Place action
+                    logits.masked_fill_(is_destroy & inv_destroy, -torch.inf)
+            if not return_dist:
+                if not greedy:
+                    actions.append(F.gumbel_softmax(logits, hard=True))
+                else:
+                    actions.append(F.one_hot(logits.argmax(dim=-1), logits.shape[-1]).to(logits.dtype))
             else:
-                actions.append(actions_dist[-1].mode)
+                actions_dist.append(OneHotCategoricalStraightThrough(logits=logits))
+                if not greedy:
+                    actions.append(actions_dist[-1].rsample())
+                else:
+                    actions.append(actions_dist[-1].mode)
             if functional_action is None:
                 functional_action = actions[0].argmax(dim=-1)  # [T, B]
         return tuple(actions), tuple(actions_dist)
@@ -660,42 +827,62 @@ class MinedojoActor(Actor):
     def add_exploration_noise(
         self, actions: Sequence[Tensor], step: int = 0, mask: Optional[Dict[str, Tensor]] = None
     ) -> Sequence[Tensor]:
-        expl_actions = []
+        # Constant across the action heads: computed once instead of per iteration
+        base_expl_amount = self._get_expl_amount(step)
+        # One RNG draw provides the uniform exploratory candidates for all the heads
+        # (with a mask, the candidates are drawn from the masked logits instead)
+        uniform_samples = _uniform_one_hot_samples(actions) if mask is None else None
+        # Pre-sized result list: index assignment instead of append avoids the list
+        # growth and the final copy on every env step
+        expl_actions: List[Optional[Tensor]] = [None] * len(actions)
         functional_action = actions[0].argmax(dim=-1)
+        orig_functional_action = functional_action
+        force_change = None
+        if mask is not None:
+            # Inverted boolean masks computed once per call: `masked_fill_` broadcasts
+            # them against the logits, so no per-head `expand_as`/`logical_not` is needed
+            inv_action_type = torch.logical_not(mask["mask_action_type"])
+            inv_craft_smelt = torch.logical_not(mask["mask_craft_smelt"])
+            inv_equip_place = torch.logical_not(mask["mask_equip_place"])
+            inv_destroy = torch.logical_not(mask["mask_destroy"])
         for i, act in enumerate(actions):
-            logits = torch.zeros_like(act)
-            # Exploratory action must respect the constraints of the environment
+            # Exploratory action must respect the constraints of the environment:
+            # the masks are applied over the whole [T, B] batch with broadcast boolean
+            # selectors, with no per-(t, b) `.item()` round trips to the host, and the
+            # candidates are actually drawn from the masked logits (they were previously
+            # sampled from a fresh all-zero tensor, silently discarding the masking work)
             if mask is not None:
+                logits = torch.zeros_like(act)
                 if i == 0:
-                    logits[torch.logical_not(mask["mask_action_type"].expand_as(logits))] = -torch.inf
+                    logits.masked_fill_(inv_action_type, -torch.inf)
                 elif i == 1:
-                    mask["mask_craft_smelt"] = mask["mask_craft_smelt"].expand_as(logits)
-                    for t in range(functional_action.shape[0]):
-                        for b in range(functional_action.shape[1]):
-                            sampled_action = functional_action[t, b].item()
-                            if sampled_action == 15:  # Craft action
-                                logits[t, b][torch.logical_not(mask["mask_craft_smelt"][t, b])] = -torch.inf
+                    is_craft = (functional_action == self.CRAFT_ACTION).unsqueeze(-1)  # Craft action
+                    logits.masked_fill_(is_craft & inv_craft_smelt, -torch.inf)
                 elif i == 2:
-                    mask["mask_destroy"][t, b] = mask["mask_destroy"].expand_as(logits)
-                    mask["mask_equip_place"] = mask["mask_equip_place"].expand_as(logits)
-                    for t in range(functional_action.shape[0]):
-                        for b in range(functional_action.shape[1]):
-                            sampled_action = functional_action[t, b].item()
-                            if sampled_action in {16, 17}:  # Equip/Place action
-                                logits[t, b][torch.logical_not(mask["mask_equip_place"][t, b])] = -torch.inf
-                            elif sampled_action == 18:  # Destroy action
-                                logits[t, b][torch.logical_not(mask["mask_destroy"][t, b])] = -torch.inf
-            sample = OneHotCategorical(logits=torch.zeros_like(act)).sample().to(act.device)
-            expl_amount = self._get_expl_amount(step)
-            # If the action[0] was changed, and now it is critical, then we force to change also the other 2 actions
-            # to satisfy the constraints of the environment
-            if (
-                i in {1, 2}
-                and actions[0].argmax() != expl_actions[0].argmax()
-                and expl_actions[0].argmax().item() in {15, 16, 17, 18}
-            ):
-                expl_amount = 2
-            expl_actions.append(torch.where(torch.rand(act.shape[:1], device=self.device) < expl_amount, sample, act))
+                    is_equip_place = (
+                        (functional_action == self.EQUIP_ACTION) | (functional_action == self.PLACE_ACTION)
+                    ).unsqueeze(-1)
+                    is_destroy = (functional_action == self.DESTROY_ACTION).unsqueeze(-1)
+                    logits.masked_fill_(is_equip_place & inv_equip_place, -torch.inf)  # Equip/Place action
+                    logits.masked_fill_(is_destroy & inv_destroy, -torch.inf)
+                idx = torch.multinomial(F.softmax(logits, dim=-1).reshape(-1, act.shape[-1]), 1)
+                sample = F.one_hot(idx.reshape(act.shape[:-1]), act.shape[-1]).to(act.dtype)
+            else:
+                sample = uniform_samples[i]
+            if i == 0:
+                expl_amount = act.new_full((), base_expl_amount)
+            else:
+                if force_change is None:
+                    # Evaluated per batch element with no host syncs: where the noise changed
+                    # the action[0] into a critical one, the other 2 actions of those elements
+                    # are forced to change as well (amount 2 guarantees the resampling) to
+                    # satisfy the constraints of the environment
+                    new_functional_action = expl_actions[0].argmax(dim=-1)
+                    force_change = (orig_functional_action != new_functional_action) & torch.isin(
+                        new_functional_action, self._critical_actions
+                    )
+                expl_amount = torch.where(force_change, act.new_full((), 2.0), act.new_full((), base_expl_amount))
+            expl_actions[i] = _mix(sample, act, expl_amount, self._exploration_noise(act))
             if mask is not None and i == 0:
                 functional_action = expl_actions[0].argmax(dim=-1)
         return tuple(expl_actions)
@@ -711,6 +898,11 @@ class WorldModel(nn.Module):
         observation_model (nn.module): the observation model.
         reward_model (nn.module): the reward model.
         continue_model (nn.module, optional): the continue model.
+        compile_models (bool): whether to `torch.compile` the dense submodules
+            (observation, reward and continue models) individually. The encoder is
+            left uncompiled (its convolutions are already cuDNN/Inductor-bound) and
+            the RSSM keeps its own compiled dynamic step.
+            Default to False.
     """
 
     def __init__(
@@ -720,10 +912,23 @@ class WorldModel(nn.Module):
         observation_model: nn.module,
         reward_model: nn.module,
         continue_model: Optional[nn.module],
+        compile_models: bool = False,
     ) -> None:
         super().__init__()
         self.encoder = encoder
         self.rssm = rssm
         self.observation_model = observation_model
         self.reward_model = reward_model
-        self.continue_model = continue_model
\ No newline at end of file
+        self.continue_model = continue_model
+        if compile_models:
+            # Selective compilation of the compute-heavy dense heads only: compiling the
+            # whole wrapper would drag the Python-heavy loss code into the graph. Binding
+            # the compiled forwards keeps the modules (and their state_dicts) intact.
+            self.observation_model.forward = torch.compile(
+                self.observation_model.forward, mode="reduce-overhead", dynamic=False
+            )
+            self.reward_model.forward = torch.compile(self.reward_model.forward, mode="reduce-overhead", dynamic=False)
+            if self.continue_model is not None:
+                self.continue_model.forward = torch.compile(
+                    self.continue_model.forward, mode="reduce-overhead", dynamic=False
+                )
\ No newline at end of file
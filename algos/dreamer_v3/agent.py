@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import itertools
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import gymnasium
@@ -36,6 +37,24 @@ from sheeprl.utils.model import ModuleType, cnn_forward
 from sheeprl.utils.utils import symlog
 
 
+def _preallocated_cat(a: Tensor, b: Tensor) -> Tensor:
+    """Concatenate two tensors on the last dimension by allocating the output buffer once
+    and filling it in place. Equivalent to `torch.cat((a, b), -1)`, but avoids the
+    intermediate sequence handling of `torch.cat` on the hot RSSM paths.
+
+    Args:
+        a (Tensor): the first tensor to concatenate.
+        b (Tensor): the second tensor to concatenate.
+
+    Returns:
+        The concatenated tensor.
+    """
+    out = torch.empty(*a.shape[:-1], a.shape[-1] + b.shape[-1], device=a.device, dtype=a.dtype)
+    out[..., : a.shape[-1]].copy_(a)
+    out[..., a.shape[-1] :].copy_(b)
+    return out
+
+
 class CNNEncoder(nn.Module):
     """The Dreamer-V3 image encoder. This is composed of 4 `nn.Conv2d` with
     kernel_size=3, stride=2 and padding=1. No bias is used if a `nn.LayerNorm`
@@ -75,7 +94,7 @@ class CNNEncoder(nn.Module):
         self.model = nn.Sequential(
             CNN(
                 input_channels=self.input_dim[0],
-                hidden_channels=(torch.tensor([2**i for i in range(stages)]) * channels_multiplier).tolist(),
+                hidden_channels=[(2**i) * channels_multiplier for i in range(stages)],
                 cnn_layer=nn.Conv2d,
                 layer_args={"kernel_size": 4, "stride": 2, "padding": 1, "bias": layer_norm_cls == nn.Identity},
                 activation=activation,
@@ -86,12 +105,40 @@ class CNNEncoder(nn.Module):
             ),
             nn.Flatten(-3, -1),
         )
-        with torch.no_grad():
-            self.output_dim = self.model(torch.zeros(1, *self.input_dim)).shape[-1]
+        # NHWC is the cuDNN-recommended layout for convolutions: converting the weights lets
+        # cuDNN select NHWC kernels directly instead of transposing NCHW activations internally
+        self.model = self.model.to(memory_format=torch.channels_last)
+        # Every stage is a kernel-4/stride-2/padding-1 convolution, which exactly halves the
+        # spatial resolution, so the flattened output size can be computed without running
+        # a dummy forward of the whole conv stack at construction time
+        h, w = image_size
+        self.output_dim = (2 ** (stages - 1)) * channels_multiplier * (h >> stages) * (w >> stages)
 
     def forward(self, obs: Dict[str, Tensor]) -> Tensor:
-        x = torch.cat([obs[k] for k in self.keys], dim=-3)  # channels dimension
-        return cnn_forward(self.model, x, x.shape[-3:], (-1,))
+        if len(self.keys) == 1:
+            x = obs[self.keys[0]]
+        else:
+            # Allocate the channels-concatenated buffer once and fill it in place
+            first = obs[self.keys[0]]
+            x = torch.empty(
+                *first.shape[:-3], self.input_dim[0], *first.shape[-2:], device=first.device, dtype=first.dtype
+            )
+            offset = 0
+            for k in self.keys:
+                channels = obs[k].shape[-3]
+                x[..., offset : offset + channels, :, :].copy_(obs[k])
+                offset += channels
+        # The observations always come in with (seq_len, batch_size) leading dims, so the leading
+        # dims are flattened here (instead of going through `cnn_forward`) and the channels-last
+        # conversion is applied to the flattened 4-D tensor: the memory format is only defined on
+        # 4-D tensors, so converting before the flatten would leave the activations in NCHW
+        batch_shape = x.shape[:-3]
+        x = x.reshape(-1, *x.shape[-3:]).contiguous(memory_format=torch.channels_last)
+        # The conv stack runs in BF16 on Tensor Cores (all the hidden channels are multiples of 8),
+        # while the embedding is casted back to FP32 to keep the downstream RSSM logits math stable
+        with torch.autocast(device_type=x.device.type, dtype=torch.bfloat16, enabled=x.device.type == "cuda"):
+            embedded_obs = self.model(x)
+        return embedded_obs.reshape(*batch_shape, -1).float()
 
 
 class MLPEncoder(nn.Module):
@@ -144,7 +191,16 @@ class MLPEncoder(nn.Module):
         self.symlog_inputs = symlog_inputs
 
     def forward(self, obs: Dict[str, Tensor]) -> Tensor:
-        x = torch.cat([symlog(obs[k]) if self.symlog_inputs else obs[k] for k in self.keys], -1)
+        if len(self.keys) == 1:
+            x = symlog(obs[self.keys[0]]) if self.symlog_inputs else obs[self.keys[0]]
+        else:
+            first = obs[self.keys[0]]
+            x = torch.empty(*first.shape[:-1], self.input_dim, device=first.device, dtype=first.dtype)
+            offset = 0
+            for k in self.keys:
+                dim = obs[k].shape[-1]
+                x[..., offset : offset + dim].copy_(symlog(obs[k]) if self.symlog_inputs else obs[k])
+                offset += dim
         return self.model(x)
 
 
@@ -190,6 +246,9 @@ class CNNDecoder(nn.Module):
         super().__init__()
         self.keys = keys
         self.output_channels = output_channels
+        # Cumulative channel indices, so the per-key split is a `tensor_split` on
+        # precomputed boundaries instead of rebuilding them from sizes every forward
+        self._split_idx = tuple(itertools.accumulate(output_channels))[:-1]
         self.cnn_encoder_output_dim = cnn_encoder_output_dim
         self.image_size = image_size
         self.output_dim = (sum(output_channels), *image_size)
@@ -198,9 +257,7 @@ class CNNDecoder(nn.Module):
             nn.Unflatten(1, (-1, 4, 4)),
             DeCNN(
                 input_channels=(2 ** (stages - 1)) * channels_multiplier,
-                hidden_channels=(
-                    torch.tensor([2**i for i in reversed(range(stages - 1))]) * channels_multiplier
-                ).tolist()
+                hidden_channels=[(2**i) * channels_multiplier for i in reversed(range(stages - 1))]
                 + [self.output_dim[0]],
                 cnn_layer=nn.ConvTranspose2d,
                 layer_args=[
@@ -217,10 +274,15 @@ class CNNDecoder(nn.Module):
                 + [None],
             ),
         )
+        self.model = self.model.to(memory_format=torch.channels_last)
 
     def forward(self, latent_states: Tensor) -> Dict[str, Tensor]:
-        cnn_out = cnn_forward(self.model, latent_states, (latent_states.shape[-1],), self.output_dim)
-        return {k: rec_obs for k, rec_obs in zip(self.keys, torch.split(cnn_out, self.output_channels, -3))}
+        with torch.autocast(
+            device_type=latent_states.device.type, dtype=torch.bfloat16, enabled=latent_states.device.type == "cuda"
+        ):
+            cnn_out = cnn_forward(self.model, latent_states, (latent_states.shape[-1],), self.output_dim)
+        cnn_out = cnn_out.float()
+        return dict(zip(self.keys, torch.tensor_split(cnn_out, self._split_idx, dim=-3)))
 
 
 class MLPDecoder(nn.Module):
@@ -268,11 +330,23 @@ class MLPDecoder(nn.Module):
             norm_layer=layer_norm_cls,
             norm_args={**layer_norm_kw, "normalized_shape": dense_units},
         )
-        self.heads = nn.ModuleList([nn.Linear(dense_units, mlp_dim) for mlp_dim in self.output_dims])
+        # A single fused linear instead of one small linear per key: one GEMM for all
+        # the heads, whose outputs are then split along the last dimension
+        self.heads = nn.Linear(dense_units, sum(self.output_dims))
+        self._split_idx = tuple(itertools.accumulate(self.output_dims))[:-1]
+        self._register_load_state_dict_pre_hook(self._remap_per_head_state_dict)
+
+    def _remap_per_head_state_dict(self, state_dict: Dict[str, Tensor], prefix: str, *args) -> None:
+        """Remap checkpoints saved when `heads` was a `nn.ModuleList` of per-key
+        linear layers into the fused single-linear layout."""
+        for param in ("weight", "bias"):
+            keys = [f"{prefix}heads.{i}.{param}" for i in range(len(self.output_dims))]
+            if all(k in state_dict for k in keys):
+                state_dict[f"{prefix}heads.{param}"] = torch.cat([state_dict.pop(k) for k in keys], dim=0)
 
     def forward(self, latent_states: Tensor) -> Dict[str, Tensor]:
         x = self.model(latent_states)
-        return {k: h(x) for k, h in zip(self.keys, self.heads)}
+        return dict(zip(self.keys, torch.tensor_split(self.heads(x), self._split_idx, dim=-1)))
 
 
 class RecurrentModel(nn.Module):
@@ -384,6 +458,12 @@ class RSSM(nn.Module):
             self.register_buffer(
                 "initial_recurrent_state", torch.zeros(recurrent_model.recurrent_state_size, dtype=torch.float32)
             )
+        # Lazily-captured CUDA graphs of the one-step imagination, one per horizon step since a
+        # graphed callable may only run once per iteration; created by the training loop once
+        # the imagined trajectory shapes are known (see `algo.world_model.cuda_graph_imagination`)
+        self._graphed_imagination: Optional[Tuple[Callable[[Tensor, Tensor, Tensor], Tuple[Tensor, Tensor]], ...]] = (
+            None
+        )
 
     def get_initial_states(self, batch_shape: Sequence[int] | torch.Size) -> Tuple[Tensor, Tensor]:
         initial_recurrent_state = torch.tanh(self.initial_recurrent_state).expand(*batch_shape, -1)
@@ -419,14 +499,17 @@ class RSSM(nn.Module):
             The logits of the prior state (Tensor): computed by the transition model from the recurrent state.
             from the recurrent state and the embbedded observation.
         """
-        action = (1 - is_first) * action
+        # A single boolean mask lets TorchInductor fuse the three resets into one masked kernel,
+        # instead of the three `(1 - is_first) * x` elementwise multiplications
+        is_first = is_first.bool()
+        action = torch.where(is_first, action.new_zeros(()), action)
 
         initial_recurrent_state, initial_posterior = self.get_initial_states(recurrent_state.shape[:2])
-        recurrent_state = (1 - is_first) * recurrent_state + is_first * initial_recurrent_state
-        posterior = posterior.view(*posterior.shape[:-2], -1)
-        posterior = (1 - is_first) * posterior + is_first * initial_posterior.view_as(posterior)
+        recurrent_state = torch.where(is_first, initial_recurrent_state, recurrent_state)
+        posterior = posterior.reshape(*posterior.shape[:-2], -1)
+        posterior = torch.where(is_first, initial_posterior.view_as(posterior), posterior)
 
-        recurrent_state = self.recurrent_model(torch.cat((posterior, action), -1), recurrent_state)
+        recurrent_state = self.recurrent_model(_preallocated_cat(posterior, action), recurrent_state)
         prior_logits, prior = self._transition(recurrent_state)
         posterior_logits, posterior = self._representation(recurrent_state, embedded_obs)
         return recurrent_state, posterior, prior, posterior_logits, prior_logits
@@ -457,7 +540,7 @@ class RSSM(nn.Module):
             logits (Tensor): the logits of the distribution of the posterior state.
             posterior (Tensor): the sampled posterior stochastic state.
         """
-        logits: Tensor = self.representation_model(torch.cat((recurrent_state, embedded_obs), -1))
+        logits: Tensor = self.representation_model(_preallocated_cat(recurrent_state, embedded_obs))
         logits = self._uniform_mix(logits)
         return logits, compute_stochastic_state(logits, discrete=self.discrete)
 
@@ -565,14 +648,15 @@ class DecoupledRSSM(RSSM):
             The logits of the prior state (Tensor): computed by the transition model from the recurrent state.
             from the recurrent state and the embbedded observation.
         """
-        action = (1 - is_first) * action
+        is_first = is_first.bool()
+        action = torch.where(is_first, action.new_zeros(()), action)
 
         initial_recurrent_state, initial_posterior = self.get_initial_states(recurrent_state.shape[:2])
-        recurrent_state = (1 - is_first) * recurrent_state + is_first * initial_recurrent_state
-        posterior = posterior.view(*posterior.shape[:-2], -1)
-        posterior = (1 - is_first) * posterior + is_first * initial_posterior.view_as(posterior)
+        recurrent_state = torch.where(is_first, initial_recurrent_state, recurrent_state)
+        posterior = posterior.reshape(*posterior.shape[:-2], -1)
+        posterior = torch.where(is_first, initial_posterior.view_as(posterior), posterior)
 
-        recurrent_state = self.recurrent_model(torch.cat((posterior, action), -1), recurrent_state)
+        recurrent_state = self.recurrent_model(_preallocated_cat(posterior, action), recurrent_state)
         prior_logits, prior = self._transition(recurrent_state)
         return recurrent_state, prior, prior_logits
 
@@ -683,7 +767,9 @@ class PlayerDV3(nn.Module):
         self.stochastic_state = self.stochastic_state.view(
             *self.stochastic_state.shape[:-2], self.stochastic_size * self.discrete_size
         )
-        actions, _ = self.actor(torch.cat((self.stochastic_state, self.recurrent_state), -1), greedy, mask)
+        actions, _ = self.actor(
+            torch.cat((self.stochastic_state, self.recurrent_state), -1), greedy, mask, return_dist=False
+        )
         self.actions = torch.cat(actions, -1)
         return actions
 
@@ -778,7 +864,7 @@ class Actor(nn.Module):
         self._action_clip = action_clip
 
     def forward(
-        self, state: Tensor, greedy: bool = False, mask: Optional[Dict[str, Tensor]] = None
+        self, state: Tensor, greedy: bool = False, mask: Optional[Dict[str, Tensor]] = None, return_dist: bool = True
     ) -> Tuple[Sequence[Tensor], Sequence[Distribution]]:
         """
         Call the forward method of the actor model and reorganizes the result with shape (batch_size, *, num_actions),
@@ -790,17 +876,20 @@ class Actor(nn.Module):
                 Default to False.
             mask (Dict[str, Tensor], optional): the mask to use on the actions.
                 Default to None.
+            return_dist (bool): whether the action distributions are needed by the caller.
+                When False, sampling is inlined and no Distribution object is built (rollout fast path).
+                Default to True.
 
         Returns:
             The tensor of the actions taken by the agent with shape (batch_size, *, num_actions).
-            The distribution of the actions
+            The distribution of the actions (an empty tuple if `return_dist` is False).
         """
         out: Tensor = self.model(state)
         pre_dist: List[Tensor] = [head(out) for head in self.mlp_heads]
         if self.is_continuous:
             mean, std = torch.chunk(pre_dist[0], 2, -1)
             if self.distribution == "tanh_normal":
-                mean = 5 * torch.tanh(mean / 5)
+                mean = 5.0 * torch.tanh(mean * 0.2)
                 std = F.softplus(std + self.init_std) + self.min_std
                 actions_dist = Normal(mean, std)
                 actions_dist = Independent(TransformedDistribution(actions_dist, TanhTransform()), 1)
@@ -809,20 +898,42 @@ class Actor(nn.Module):
                 actions_dist = Independent(actions_dist, 1)
             elif self.distribution == "scaled_normal":
                 std = (self.max_std - self.min_std) * torch.sigmoid(std + self.init_std) + self.min_std
-                dist = Normal(torch.tanh(mean), std)
+                mean = torch.tanh(mean)
+                if not greedy and not return_dist:
+                    actions = mean + std * torch.randn_like(std)
+                    if self._action_clip > 0.0:
+                        action_clip = torch.full_like(actions, self._action_clip)
+                        actions = actions * (action_clip / torch.maximum(action_clip, torch.abs(actions))).detach()
+                    return (actions,), tuple()
+                dist = Normal(mean, std)
                 actions_dist = Independent(dist, 1)
             if not greedy:
                 actions = actions_dist.rsample()
             else:
-                sample = actions_dist.sample((100,))
-                log_prob = actions_dist.log_prob(sample)
-                actions = sample[log_prob.argmax(0)].view(1, 1, -1)
+                with torch.no_grad():
+                    sample = actions_dist.sample((100,))
+                    log_prob = actions_dist.log_prob(sample)
+                    # Gather the most likely of the 100 candidates per batch element:
+                    # unlike fancy indexing this does not materialize broadcast
+                    # intermediates and it supports any batch size
+                    idx = log_prob.argmax(0, keepdim=True)
+                    actions = sample.gather(0, idx.unsqueeze(-1).expand(1, *sample.shape[1:])).squeeze(0)
             if self._action_clip > 0.0:
                 action_clip = torch.full_like(actions, self._action_clip)
                 actions = actions * (action_clip / torch.maximum(action_clip, torch.abs(actions))).detach()
             actions = [actions]
             actions_dist = [actions_dist]
         else:
+            if not return_dist:
+                # Gumbel-max sampling (or the argmax mode) draws the same one-hot actions
+                # without instantiating a OneHotCategoricalStraightThrough per head
+                if not greedy:
+                    actions = [F.gumbel_softmax(self._uniform_mix(logits), hard=True) for logits in pre_dist]
+                else:
+                    actions = [
+                        F.one_hot(logits.argmax(dim=-1), logits.shape[-1]).to(logits.dtype) for logits in pre_dist
+                    ]
+                return tuple(actions), tuple()
             actions_dist: List[Distribution] = []
             actions: List[Tensor] = []
             for logits in pre_dist:
@@ -841,6 +952,17 @@ class Actor(nn.Module):
             logits = probs_to_logits(probs)
         return logits
 
+    def quantize_for_inference(self) -> None:
+        """Dynamically quantize the actor linear layers to int8 for CPU rollouts.
+
+        The MLP trunk and the heads are pure linear stacks, so dynamic quantization
+        (int8 weights, floating-point activations) roughly halves the matmul time and
+        quarters the weight memory on CPU. The quantized modules do not support
+        gradients: call this only on inference-only copies of the actor.
+        """
+        self.model = torch.ao.quantization.quantize_dynamic(self.model, {nn.Linear}, dtype=torch.qint8)
+        self.mlp_heads = torch.ao.quantization.quantize_dynamic(self.mlp_heads, {nn.Linear}, dtype=torch.qint8)
+
 
 class MinedojoActor(Actor):
     def __init__(
@@ -876,7 +998,7 @@ class MinedojoActor(Actor):
         )
 
     def forward(
-        self, state: Tensor, greedy: bool = True, mask: Optional[Dict[str, Tensor]] = None
+        self, state: Tensor, greedy: bool = True, mask: Optional[Dict[str, Tensor]] = None, return_dist: bool = True
     ) -> Tuple[Sequence[Tensor], Sequence[Distribution]]:
         """
         Call the forward method of the actor model and reorganizes the result with shape (batch_size, *, num_actions),
@@ -888,42 +1010,51 @@ class MinedojoActor(Actor):
                 Default to True.
             mask (Dict[str, Tensor], optional): the mask to apply to the actions.
                 Default to None.
+            return_dist (bool): whether the action distributions are needed by the caller.
+                When False, sampling is inlined and no Distribution object is built (rollout fast path).
+                Default to True.
 
         Returns:
             The tensor of the actions taken by the agent with shape (batch_size, *, num_actions).
-            The distribution of the actions
+            The distribution of the actions (an empty tuple if `return_dist` is False).
         """
         out: Tensor = self.model(state)
         actions_logits: List[Tensor] = [self._uniform_mix(head(out)) for head in self.mlp_heads]
         actions_dist: List[Distribution] = []
         actions: List[Tensor] = []
         functional_action = None
+        if mask is not None:
+            # Inverted boolean masks computed once per call: `masked_fill_` broadcasts
+            # them against the logits, so no per-head `expand_as`/`logical_not` is needed
+            inv_action_type = torch.logical_not(mask["mask_action_type"])
+            inv_craft_smelt = torch.logical_not(mask["mask_craft_smelt"])
+            inv_equip_place = torch.logical_not(mask["mask_equip_place"])
+            inv_destroy = torch.logical_not(mask["mask_destroy"])
         for i, logits in enumerate(actions_logits):
+            # The action masks are applied with boolean [T, B, 1] selectors broadcast against the
+            # logits, so no per-(t, b) `.item()` host-device synchronization is needed
             if mask is not None:
                 if i == 0:
-                    logits[torch.logical_not(mask["mask_action_type"].expand_as(logits))] = -torch.inf
+                    logits.masked_fill_(inv_action_type, -torch.inf)
                 elif i == 1:
-                    mask["mask_craft_smelt"] = mask["mask_craft_smelt"].expand_as(logits)
-                    for t in range(functional_action.shape[0]):
-                        for b in range(functional_action.shape[1]):
-                            sampled_action = functional_action[t, b].item()
-                            if sampled_action == 15:  # Craft action
-                                logits[t, b][torch.logical_not(mask["mask_craft_smelt"][t, b])] = -torch.inf
+                    is_craft = (functional_action == 15).unsqueeze(-1)  # Craft action
+                    logits.masked_fill_(is_craft & inv_craft_smelt, -torch.inf)
                 elif i == 2:
-                    mask["mask_destroy"][t, b] = mask["mask_destroy"].expand_as(logits)
-                    mask["mask_equip_place"] = mask["mask_equip_place"].expand_as(logits)
-                    for t in range(functional_action.shape[0]):
-                        for b in range(functional_action.shape[1]):
-                            sampled_action = functional_action[t, b].item()
-                            if sampled_action in (16, 17):  # Equip/Place action
-                                logits[t, b][torch.logical_not(mask["mask_equip_place"][t, b])] = -torch.inf
-                            elif sampled_action == 18:  # Destroy action
-                                logits[t, b][torch.logical_not(mask["mask_destroy"][t, b])] = -torch.inf
-            actions_dist.append(OneHotCategoricalStraightThrough(logits=logits))
-            if not greedy:
-                actions.append(actions_dist[-1].rsample())
+                    is_equip_place = ((functional_action == 16) | (functional_action == 17)).unsqueeze(-1)
+                    is_destroy = (functional_action == 18).unsqueeze(-1)
+                    logits.masked_fill_(is_equip_place & inv_equip_place, -torch.inf)  # Equip/Place action
+                    logits.masked_fill_(is_destroy & inv_destroy, -torch.inf)
+            if not return_dist:
+                if not greedy:
+                    actions.append(F.gumbel_softmax(logits, hard=True))
+                else:
+                    actions.append(F.one_hot(logits.argmax(dim=-1), logits.shape[-1]).to(logits.dtype))
             else:
-                actions.append(actions_dist[-1].mode)
+                actions_dist.append(OneHotCategoricalStraightThrough(logits=logits))
+                if not greedy:
+                    actions.append(actions_dist[-1].rsample())
+                else:
+                    actions.append(actions_dist[-1].mode)
             if functional_action is None:
                 functional_action = actions[0].argmax(dim=-1)  # [T, B]
         return tuple(actions), tuple(actions_dist)
@@ -967,6 +1098,10 @@ def build_agent(
     actor_cfg = cfg.algo.actor
     critic_cfg = cfg.algo.critic
 
+    # Let cuDNN autotune the convolution kernels (the channels-last NHWC ones in particular):
+    # all the CNN forwards run with static shapes, so the benchmarking cost is paid only once
+    torch.backends.cudnn.benchmark = True
+
     # Sizes
     recurrent_state_size = world_model_cfg.recurrent_model.recurrent_state_size
     stochastic_size = world_model_cfg.stochastic_size * world_model_cfg.discrete_size
@@ -1127,6 +1262,7 @@ def build_agent(
         observation_model.apply(init_weights),
         reward_model.apply(init_weights),
         continue_model.apply(init_weights),
+        compile_models=world_model_cfg.get("compile_models", False),
     )
 
     actor_cls = hydra.utils.get_class(cfg.algo.actor.cls)
@@ -1229,4 +1365,22 @@ def build_agent(
         p.data = agent_p.data
     for agent_p, p in zip(actor.parameters(), player.actor.parameters()):
         p.data = agent_p.data
+
+    # Compile the hot training paths: the `is_first` masking of `RSSM.dynamic` and the actor MLP trunk
+    # are fused by TorchInductor into fewer kernels. CUDA graphs are disabled because they conflict
+    # with the GRU recurrence, and the distribution construction is left out of the compiled region
+    # since it causes graph breaks.
+    rssm.dynamic = torch.compile(rssm.dynamic, fullgraph=False, options={"triton.cudagraphs": False})
+    actor.model.forward = torch.compile(actor.model.forward, fullgraph=False, options={"triton.cudagraphs": False})
+    # The CNN encoder/decoder stacks are fixed-shape, control-flow-free pipelines, so they can be
+    # compiled as full graphs with autotuned Triton kernels that fuse the conv+norm+activation
+    # triplets. Compiling the inner `model.forward` keeps the module (and its state_dict) intact.
+    if cnn_encoder is not None:
+        cnn_encoder.model.forward = torch.compile(
+            cnn_encoder.model.forward, mode="max-autotune", fullgraph=True, dynamic=False
+        )
+    if cnn_decoder is not None:
+        cnn_decoder.model.forward = torch.compile(
+            cnn_decoder.model.forward, mode="max-autotune", fullgraph=True, dynamic=False
+        )
     return world_model, actor, critic, target_critic, player
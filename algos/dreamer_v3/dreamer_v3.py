@@ -224,9 +224,34 @@ def train(
     # Continues:     c0      c'1      c'2      c'3
     # where z0 comes from the posterior, while z'i is the imagined states (prior)
 
-    # Imagine trajectories in the latent space
+    # Imagine trajectories in the latent space. The imagination step runs with the same shapes at
+    # every gradient step, so each horizon step can optionally be captured once in a CUDA graph
+    # and replayed, removing the Python-side kernel-launch overhead of the inner loop. One graph
+    # per horizon step is required: a graphed callable owns static input/activation buffers and
+    # may only be invoked (and backpropagated through) once per iteration, so replaying a single
+    # graph for the whole horizon would make every backward replay read the last step's saved
+    # activations. The callables share the RSSM parameters and are invoked in capture order
+    graphed_imagination = None
+    if cfg.algo.world_model.get("cuda_graph_imagination", False) and device.type == "cuda":
+        if world_model.rssm._graphed_imagination is None:
+            world_model.rssm._graphed_imagination = torch.cuda.make_graphed_callables(
+                tuple(world_model.rssm.imagination for _ in range(cfg.algo.horizon)),
+                tuple(
+                    (
+                        imagined_prior.clone().requires_grad_(True),
+                        recurrent_state.clone().requires_grad_(True),
+                        actions.detach().clone().requires_grad_(True),
+                    )
+                    for _ in range(cfg.algo.horizon)
+                ),
+            )
+        graphed_imagination = world_model.rssm._graphed_imagination
+        # The captured graphs expect differentiable inputs also at the first horizon step
+        imagined_prior = imagined_prior.clone().requires_grad_(True)
+        recurrent_state = recurrent_state.clone().requires_grad_(True)
     for i in range(1, cfg.algo.horizon + 1):
-        imagined_prior, recurrent_state = world_model.rssm.imagination(imagined_prior, recurrent_state, actions)
+        imagination = world_model.rssm.imagination if graphed_imagination is None else graphed_imagination[i - 1]
+        imagined_prior, recurrent_state = imagination(imagined_prior, recurrent_state, actions)
         imagined_prior = imagined_prior.view(1, -1, stoch_state_size)
         imagined_latent_state = torch.cat((imagined_prior, recurrent_state), -1)
         imagined_trajectories[i] = imagined_latent_state
@@ -314,28 +339,31 @@ def train(
 
     # Log metrics
     if aggregator and not aggregator.disabled:
-        aggregator.update("Loss/world_model_loss", rec_loss.detach())
-        aggregator.update("Loss/observation_loss", observation_loss.detach())
-        aggregator.update("Loss/reward_loss", reward_loss.detach())
-        aggregator.update("Loss/state_loss", state_loss.detach())
-        aggregator.update("Loss/continue_loss", continue_loss.detach())
-        aggregator.update("State/kl", kl.mean().detach())
-        aggregator.update(
-            "State/post_entropy",
-            Independent(OneHotCategorical(logits=posteriors_logits.detach()), 1).entropy().mean().detach(),
-        )
-        aggregator.update(
-            "State/prior_entropy",
-            Independent(OneHotCategorical(logits=priors_logits.detach()), 1).entropy().mean().detach(),
-        )
-        aggregator.update("Loss/policy_loss", policy_loss.detach())
-        aggregator.update("Loss/value_loss", value_loss.detach())
+        metrics_to_update = {
+            "Loss/world_model_loss": rec_loss.detach(),
+            "Loss/observation_loss": observation_loss.detach(),
+            "Loss/reward_loss": reward_loss.detach(),
+            "Loss/state_loss": state_loss.detach(),
+            "Loss/continue_loss": continue_loss.detach(),
+            "State/kl": kl.mean().detach(),
+            "State/post_entropy": Independent(OneHotCategorical(logits=posteriors_logits.detach()), 1)
+            .entropy()
+            .mean()
+            .detach(),
+            "State/prior_entropy": Independent(OneHotCategorical(logits=priors_logits.detach()), 1)
+            .entropy()
+            .mean()
+            .detach(),
+            "Loss/policy_loss": policy_loss.detach(),
+            "Loss/value_loss": value_loss.detach(),
+        }
         if world_model_grads:
-            aggregator.update("Grads/world_model", world_model_grads.mean().detach())
+            metrics_to_update["Grads/world_model"] = world_model_grads.mean().detach()
         if actor_grads:
-            aggregator.update("Grads/actor", actor_grads.mean().detach())
+            metrics_to_update["Grads/actor"] = actor_grads.mean().detach()
         if critic_grads:
-            aggregator.update("Grads/critic", critic_grads.mean().detach())
+            metrics_to_update["Grads/critic"] = critic_grads.mean().detach()
+        aggregator.update_many(metrics_to_update)
 
     # Reset everything
     actor_optimizer.zero_grad(set_to_none=True)
@@ -570,7 +598,11 @@ def main(cfg: Dict[str, Any]):
                             torch.cat([real_act.argmax(dim=-1) for real_act in real_actions], dim=-1).cpu().numpy()
                         )
 
-                step_data["actions"] = actions.reshape((1, cfg.env.num_envs, -1))
+                actions = actions.reshape((1, cfg.env.num_envs, -1))
+                # Discrete one-hot actions only carry {0, 1}: storing them as uint8 cuts the
+                # replay memory and sampling bandwidth 4x. They are cast back to float together
+                # with the rest of the batch when the gradient steps load it.
+                step_data["actions"] = actions if is_continuous else actions.astype(np.uint8)
                 rb.add(step_data, validate_args=cfg.buffer.validate_args)
 
                 next_obs, rewards, terminated, truncated, infos = envs.step(
@@ -631,7 +663,9 @@ def main(cfg: Dict[str, Any]):
                     reset_data[k] = (real_next_obs[k][dones_idxes])[np.newaxis]
                 reset_data["terminated"] = step_data["terminated"][:, dones_idxes]
                 reset_data["truncated"] = step_data["truncated"][:, dones_idxes]
-                reset_data["actions"] = np.zeros((1, reset_envs, np.sum(actions_dim)))
+                reset_data["actions"] = np.zeros(
+                    (1, reset_envs, np.sum(actions_dim)), dtype=np.float32 if is_continuous else np.uint8
+                )
                 reset_data["rewards"] = step_data["rewards"][:, dones_idxes]
                 reset_data["is_first"] = np.zeros_like(reset_data["terminated"])
                 rb.add(reset_data, dones_idxes, validate_args=cfg.buffer.validate_args)
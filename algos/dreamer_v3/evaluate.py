@@ -54,4 +54,6 @@ def evaluate(fabric: Fabric, cfg: Dict[str, Any], state: Dict[str, Any]):
         state["actor"],
     )
     del _
+    if cfg.algo.actor.get("quantize_on_eval", False) and next(player.actor.parameters()).device.type == "cpu":
+        player.actor.quantize_for_inference()
     test(player, fabric, cfg, log_dir, greedy=False)
@@ -78,8 +78,11 @@ def prepare_obs(
     obs: Dict[str, np.ndarray], *, cnn_keys: Sequence[str] = [], num_envs: int = 1, **kwargs
 ) -> Dict[str, Tensor]:
     torch_obs = {}
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
     for k, v in obs.items():
-        torch_obs[k] = torch.from_numpy(v.copy()).to(torch.device("cuda" if torch.cuda.is_available() else "cpu")).float()
+        # One fused transfer+cast: chaining `.float()` after the device move makes
+        # a second full pass (and an extra Python call) over every observation
+        torch_obs[k] = torch.from_numpy(v.copy()).to(device, torch.float32)
         if k in cnn_keys:
             torch_obs[k] = torch_obs[k].view(1, num_envs, -1, *v.shape[-2:]) / 255 - 0.5
         else:
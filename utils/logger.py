@@ -1,10 +1,13 @@
 import os
+import re
 import warnings
 from typing import Any, Dict, Optional
 
 import hydra
 from lightning.fabric.loggers.logger import Logger
-from lightning.fabric.utilities.cloud_io import _is_dir, get_filesystem
+from lightning.fabric.utilities.cloud_io import get_filesystem
+
+_VERSION_DIR_PATTERN = re.compile(r"^version_(\d+)$")
 
 
 def get_logger(cfg: Dict[str, Any]) -> Optional[Logger]:
@@ -43,14 +46,15 @@ def get_log_dir(root_dir: str, run_name: str) -> str:
     save_dir = os.path.join("logs", "runs", root_dir, run_name)
     fs = get_filesystem(root_dir)
     try:
-        listdir_info = fs.listdir(save_dir)
-        existing_versions = []
-        for listing in listdir_info:
-            d = listing["name"]
-            bn = os.path.basename(d)
-            if _is_dir(fs, d) and bn.startswith("version_"):
-                dir_ver = bn.split("_")[1].replace("/", "")
-                existing_versions.append(int(dir_ver))
+        # The detailed listing already carries the entry type, so no per-entry
+        # `_is_dir` stat call is needed, and the version number is extracted with
+        # a single anchored regex match
+        existing_versions = [
+            int(match.group(1))
+            for listing in fs.listdir(save_dir)
+            if listing.get("type") == "directory"
+            and (match := _VERSION_DIR_PATTERN.match(os.path.basename(listing["name"].rstrip("/"))))
+        ]
         if len(existing_versions) == 0:
             version = 0
         else:
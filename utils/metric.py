@@ -26,6 +26,27 @@ class MetricAggregator:
         if metrics is not None:
             self.metrics = metrics
         self._raise_on_missing = raise_on_missing
+        # Lazily allocated pinned host buffer staging the batched scalar transfer in
+        # `compute`: pinned memory lets the device-to-host copy run asynchronously
+        self._staging: Optional[Tensor] = None
+        # Names of the metrics updated since the last reset: `compute` only reduces
+        # these, so untouched metrics neither run reductions over empty state nor
+        # trigger the torchmetrics "compute before update" warnings
+        self._dirty: set = set()
+        if self.disabled:
+            # Bind no-op fast paths once at construction: a disabled aggregator (e.g. on
+            # non-zero ranks) then pays a bare callable invocation per call instead of
+            # the `disabled` check, the dict membership test and the warning formatting
+            self.add = self.update = self.update_many = self.pop = self.reset = self._noop
+            self.compute = self._compute_disabled
+
+    @staticmethod
+    def _noop(*args: Any, **kwargs: Any) -> None:
+        return None
+
+    @staticmethod
+    def _compute_disabled() -> Dict[str, Any]:
+        return {}
 
     def __iter__(self):
         return iter(self.metrics.keys())
@@ -72,6 +93,37 @@ class MetricAggregator:
                     )
             else:
                 self.metrics[name].update(value)
+                self._dirty.add(name)
+
+    @torch.no_grad()
+    def update_many(self, values: Dict[str, Any]) -> None:
+        """Update several metrics in one call.
+
+        Compared to one `update` call per key, the disabled and membership checks are
+        paid once up front and the updates then run in one tight loop under a single
+        `no_grad` scope.
+
+        Args:
+            values (Dict[str, Any]): mapping from metric name to the value to update it with.
+
+        Raises:
+            MetricAggregatorException: If any of the metrics does not exist.
+        """
+        if self.disabled:
+            return
+        missing = values.keys() - self.metrics.keys()
+        if missing:
+            if self._raise_on_missing:
+                raise MetricAggregatorException(f"Metrics {sorted(missing)} do not exist")
+            warnings.warn(
+                f"The keys {sorted(missing)} are missing from the metric aggregator. Nothing will be added.",
+                UserWarning,
+            )
+        for name, value in values.items():
+            metric = self.metrics.get(name)
+            if metric is not None:
+                metric.update(value)
+                self._dirty.add(name)
 
     def pop(self, name: str) -> None:
         """Remove a metric from the aggregator with the given name
@@ -87,12 +139,14 @@ class MetricAggregator:
                         f"The key '{name}' is missing from the metric aggregator. Nothing will be popped.", UserWarning
                     )
             self.metrics.pop(name, None)
+            self._dirty.discard(name)
 
     def reset(self):
         """Reset all metrics to their initial state"""
         if not self.disabled:
             for metric in self.metrics.values():
                 metric.reset()
+            self._dirty.clear()
 
     def to(self, device: str | torch.device = "cpu") -> "MetricAggregator":
         """Move all metrics to the given device
@@ -113,31 +167,62 @@ class MetricAggregator:
         """
         reduced_metrics = {}
         if not self.disabled:
-            if self.metrics:
+            if self.metrics and self._dirty:
+                scalar_keys: List[str] = []
+                scalar_tensors: List[Tensor] = []
                 for k, v in self.metrics.items():
+                    # Only metrics updated since the last reset are reduced: on
+                    # sparse-metric windows this skips both the reduction over
+                    # empty state and the torchmetrics warning it would emit
+                    if k not in self._dirty:
+                        continue
                     reduced = v.compute()
                     is_tensor = torch.is_tensor(reduced)
                     if is_tensor and reduced.numel() == 1:
-                        reduced_metrics[k] = reduced.item()
+                        # Scalar tensors are batched and transferred to the host in a single
+                        # copy below, instead of one synchronizing `.item()` call per metric
+                        scalar_keys.append(k)
+                        scalar_tensors.append(reduced.reshape(()))
+                        continue
+                    if not is_tensor:
+                        warnings.warn(
+                            f"The reduced metric {k} is not a scalar tensor: type={type(reduced)}. "
+                            "This may create problems during the logging phase.",
+                            category=RuntimeWarning,
+                        )
+                        if not isnan(reduced):
+                            reduced_metrics[k] = reduced
+                    else:
+                        warnings.warn(
+                            f"The reduced metric {k} is not a scalar: size={v.size()}. "
+                            "This may create problems during the logging phase.",
+                            category=RuntimeWarning,
+                        )
+                        if not torch.isnan(reduced).any():
+                            reduced_metrics[k] = reduced
+                if scalar_tensors:
+                    stacked = torch.stack(scalar_tensors)
+                    if stacked.is_cuda:
+                        # Staged through a lazily grown pinned buffer: the copy is issued
+                        # non-blocking so it overlaps with any still-queued device work,
+                        # and the stream is synchronized only here, where Python is about
+                        # to read the values
+                        if (
+                            self._staging is None
+                            or self._staging.numel() < stacked.numel()
+                            or self._staging.dtype != stacked.dtype
+                        ):
+                            self._staging = torch.empty(stacked.numel(), dtype=stacked.dtype, pin_memory=True)
+                        values = self._staging[: stacked.numel()]
+                        values.copy_(stacked, non_blocking=True)
+                        torch.cuda.current_stream().synchronize()
                     else:
-                        if not is_tensor:
-                            warnings.warn(
-                                f"The reduced metric {k} is not a scalar tensor: type={type(reduced)}. "
-                                "This may create problems during the logging phase.",
-                                category=RuntimeWarning,
-                            )
-                        else:
-                            warnings.warn(
-                                f"The reduced metric {k} is not a scalar: size={v.size()}. "
-                                "This may create problems during the logging phase.",
-                                category=RuntimeWarning,
-                            )
-                        reduced_metrics[k] = reduced
-
-                    is_tensor = torch.is_tensor(reduced_metrics[k])
-                    if (is_tensor and torch.isnan(reduced_metrics[k]).any()) or (
-                        not is_tensor and isnan(reduced_metrics[k])
-                    ):
-                        reduced_metrics.pop(k, None)
+                        values = stacked.cpu()
+                    # One vectorized isnan over the batched scalars instead of a
+                    # per-value check inside the loop
+                    valid = torch.logical_not(torch.isnan(values)).tolist()
+                    for k, value, keep in zip(scalar_keys, values.tolist(), valid):
+                        if keep:
+                            reduced_metrics[k] = value
         return reduced_metrics
 